@@ -22,11 +22,30 @@ def call(__f, args, kwargs):
     return __f(*args, **kwargs)
 
 
+def is_package(o):
+    """A package is a (callable, args, kwargs) triple, as built by pack."""
+    return isinstance(o, (tuple, list)) and len(o) == 3 and callable(o[0])
+
+
 def unpack(package):
-    assert isinstance(package, tuple) or isinstance(package, list) and len(package) == 3
+    assert isinstance(package, (tuple, list)) and len(package) == 3
     return call(*package)
 
 
+def execute(stack):
+    """Pops and executes packages until the stack is empty.
+
+    A package schedules follow-up work by returning a list of packages (see is_package); that list is pushed so that
+    it executes, first listed first, before anything already waiting on the stack.  Any other return value is the
+    package's result and is discarded."""
+    pop = stack.pop
+    extend = stack.extend
+    while stack:
+        result = unpack(pop())
+        if isinstance(result, list) and all(is_package(p) for p in result):
+            extend(reversed(result))
+
+
 class Stack(list):
     def __init__(self, *actions: "Actions listed first execute first."):
         """
@@ -36,7 +55,7 @@ class Stack(list):
         TableAction objects are popped, translated to a (func, args, kwargs) tuple, and pushed back for processing.
 
         """
-        super().__init__(*actions[::-1])
+        super().__init__(actions[::-1])
         self.height = len(self)
         self.depth = 0
 
@@ -44,6 +63,12 @@ class Stack(list):
         super().append(o)
         self.height += 1
 
+    def extend(self, iterable):
+        """Pushes many items in one list operation, updating height once rather than per item."""
+        size_before = len(self)
+        super().extend(iterable)
+        self.height += len(self) - size_before
+
 
 def example_print(a, b, c, d, e, f, g):
     for char, val in zip('abcdefg', (a, b, c, d, e, f, g)):
@@ -51,5 +76,5 @@ def example_print(a, b, c, d, e, f, g):
 
 if __name__ == '__main__':
     unpack(pack(example_print, 1, 2, 3, 4, g=9, e=5, f=100))
-    stack = Stack(range(10, 0, -1))
+    stack = Stack(*range(10, 0, -1))
     print(stack)
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import logging
+import re
 
 import praw
 from praw.models.reddit.comment import Comment
@@ -11,6 +12,9 @@ from ..util import configuration
 
 # from typing import List
 
+# Comment permalinks end in .../comments/<submission id>/<slug>/<comment id>
+_comment_permalink_regex = re.compile(r"/comments/\w+/[^/]*/(\w+)")
+
 
 def comment_contains_username(comment: Comment):
     return Reddit.r.user.me().name in comment.body
@@ -70,13 +74,32 @@ class Reddit:
         return MentionContext({}, [])
 
     @classmethod
-    def try_to_follow_link(cls, href):
+    def prefetch(cls, things):
+        """Fetches lazy PRAW Comments through /api/info together, instead of one request apiece.
+        Submissions are left alone: one built from /api/info lacks its comment forest.
+        Anything Reddit does not return is left lazy and will fetch itself on first access, as usual."""
+        by_fullname = {thing.fullname: thing for thing in things
+                       if isinstance(thing, Comment) and not getattr(thing, "_fetched", True)}
+        if not by_fullname:
+            return
         try:
-            logging.debug("Attempting to follow href to comment: {}".format(href))
-            return cls.r.comment(href)
-        except praw.exceptions.PRAWException:
-            logging.debug("Comment failed.  Attempting to follow href to submission: {]".format(href))
-            return cls.r.submission(None, href)
+            for fetched in cls.r.info(list(by_fullname)):
+                lazy = by_fullname.get(fetched.fullname)
+                if lazy is not None:
+                    lazy.__dict__.update(fetched.__dict__)
+                    lazy._fetched = True
+        except Exception:
+            logging.exception("Batched fetch failed; leaving %d comments to fetch individually.", len(by_fullname))
+
+    @classmethod
+    def try_to_follow_link(cls, href):
+        """Returns a lazy Comment if href is a comment permalink, else a lazy Submission."""
+        permalink_match = _comment_permalink_regex.search(href)
+        if permalink_match:
+            logging.debug("Following href to comment: %s", href)
+            return cls.r.comment(permalink_match.group(1))
+        logging.debug("Following href to submission: %s", href)
+        return cls.r.submission(None, href)
 
 
 if __name__ == "__main__":
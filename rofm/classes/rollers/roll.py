@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 import random
 import re
+from functools import lru_cache
 
 from .keep import Keep
 
@@ -17,16 +18,11 @@ class Roll(list):
 
     def __init__(self, s: str, sort_by=None):
         self.original_string = s
-        match = ROLL_REGEX.match(s)
-
-        self.n = int(match.group(1)) if match.group(1) is not None else 1
-        self.k = int(match.group(2))
-        drop = match.group(3)
-        keep_str = match.group(4)
-        self.keep = drop and Keep.from_char(drop) or Keep.ALL
-        self.keep_count = self.n if not drop else int(keep_str)
+        self.n, self.k, self.keep, self.keep_count = _parse_roll_string(s)
 
         self._validate()
+        # The kept range depends only on the roll string, so it survives rerolls.
+        self._kept_range = self._get_kept_range()
 
         super().__init__(random.randint(1, self.k) for _ in range(self.n))
         self.sort(key=sort_by)
@@ -48,10 +44,10 @@ class Roll(list):
             return str(self.value())
 
         # WARNING: This is predicated on the roll being sorted increasingly.
-        kept_start, kept_end = self._get_kept_range()
+        kept_start, kept_end = self._kept_range
         bottom_dropped_dice = wrap_in_parens_if_not_empty(_join_to_string(self, 0, kept_start), pad_after=" ")
         kept_dice = _join_to_string(self, kept_start, kept_end)
-        top_dropped_dice = wrap_in_parens_if_not_empty(_join_to_string(self, kept_end, len(self)), pad_before=" ")
+        top_dropped_dice = wrap_in_parens_if_not_empty(_join_to_string(self, kept_end, self.n), pad_before=" ")
 
         return "[{}{}{}] -> {}".format(
             bottom_dropped_dice,
@@ -62,12 +58,12 @@ class Roll(list):
     def _get_kept_range(self):
         """Returns indices defining the range of dice kept.
         e.g., 4d6^3 -> [1, 4, 5, 6] will return the tuple (1, 4)"""
-        start = 0 if self.keep != Keep.TOP else len(self) - self.keep_count
-        end = len(self) if self.keep != Keep.BOTTOM else self.keep_count
+        start = 0 if self.keep != Keep.TOP else self.n - self.keep_count
+        end = self.n if self.keep != Keep.BOTTOM else self.keep_count
         return start, end
 
     def value(self):
-        return sum(self[i] for i in range(*self._get_kept_range()))
+        return sum(self[slice(*self._kept_range)])
 
     def _validate(self):
         if not 0 < self.keep_count <= self.n:
@@ -102,6 +98,8 @@ class Throw:
         # This self.format_string replaces every Roll substring with r'{}',
         #  so that the values may be injected before display
         #  e.g., '{} + {} - {}'
+        # A Throw that is just one bare Roll has no arithmetic to evaluate.
+        self._single_roll = self.format_string.strip() == r'{}'
 
     def __repr__(self):
         return "<Throw({})>".format(self.original_string)
@@ -122,6 +120,8 @@ class Throw:
         return self.format_string.format(*(roll.value() for roll in self.rolls))
 
     def value(self):
+        if self._single_roll:
+            return self.rolls[0].value()
         return eval(self.get_evaluated_string())
 
     def __str__(self):
@@ -140,6 +140,21 @@ class Throw:
             r.reroll()
 
 
+@lru_cache(maxsize=1024)
+def _parse_roll_string(s):
+    """Returns (n, k, keep, keep_count) for a roll string, e.g. '4d6^3' -> (4, 6, Keep.TOP, 3).
+    The same handful of roll strings (d20, 4d6^3, ...) recur constantly, so results are memoized."""
+    match = ROLL_REGEX.match(s)
+
+    n = int(match.group(1)) if match.group(1) is not None else 1
+    k = int(match.group(2))
+    drop = match.group(3)
+    keep_str = match.group(4)
+    keep = drop and Keep.from_char(drop) or Keep.ALL
+    keep_count = n if not drop else int(keep_str)
+    return n, k, keep, keep_count
+
+
 def _join_to_string(roll, start, end):
     return " ".join(map(str, (roll[i] for i in range(start, end))))
 
@@ -6,7 +6,7 @@ from typing import Union, Tuple
 from ..rollers.roll import Roll, Throw, STARTS_WITH_ROLL_REGEX
 
 _trash = punctuation + whitespace
-_line_regex = "^(\d+)(\s*-+\s*\d+)?(.*)"
+_line_regex = re.compile(r"^(\d+)(\s*-+\s*\d+)?(.*)")
 
 
 class Table:
@@ -15,7 +15,7 @@ class Table:
         """:param roll: Dice generation method by which outcomes are selected
         :param header: Title of the table
         :param outcomes: List of tuples"""
-        self.roll = roll if isinstance(roll, Roll) or isinstance(roll, Throw) else Throw(roll)
+        self.roll = roll if isinstance(roll, (Roll, Throw)) else Throw(roll)
         self.header = header
         self.outcomes = list(outcomes)
         self.outcomes.sort()
@@ -31,13 +31,13 @@ class Table:
 def parse_enumerated_table(text):
     lines = text.strip('\n').split('\n')
     header_line = lines.pop(0)
-    leading_header_roll = re.search(STARTS_WITH_ROLL_REGEX, header_line.strip(_trash))
+    leading_header_roll = STARTS_WITH_ROLL_REGEX.search(header_line.strip(_trash))
     if not leading_header_roll:
         raise RuntimeError("AHHHHH!")
     roll_string = leading_header_roll.group(0)
     roll = Roll(roll_string)
     header = header_line.strip(_trash)[leading_header_roll.span()[1]:]
-    outcomes = [l for l in lines if re.search(_line_regex, l.strip(_trash))]
+    outcomes = [l for l in lines if _line_regex.search(l.strip(_trash))]
     table = Table(roll, header, *outcomes)
     return table
 
@@ -2,6 +2,8 @@
 
 
 class TableEntry:
+    __slots__ = ('content', 'table_links')
+
     def __init__(self, content: str, *links):
         """A single possible outcome for a table, with link(s) to other table(s) if the outcome requires."""
         self.content = content
@@ -148,7 +148,9 @@ def set_log_levels(logging_config):
     requests = logging.getLogger("requests")
     prawcore = logging.getLogger("prawcore")
 
-    root.setLevel(logging.DEBUG)
+    # Records below every handler's level would only be built to be thrown away.
+    root.setLevel(min(logging.getLevelName(logging_config.get(Subsection.console_level)),
+                      logging.getLevelName(logging_config.get(Subsection.file_log_level))))
     rofm.setLevel(logging_config.get(Subsection.rofm_level))
     requests.setLevel(logging_config.get(Subsection.requests_level))
     prawcore.setLevel(logging_config.get(Subsection.prawcore_level))
\ No newline at end of file
@@ -68,8 +68,7 @@ def retry(maximum_count=1,
                     logging.exception("Exception occurred in attempt {} of {} in function: {}".format(attempts_made,
                                                                                                       maximum_count,
                                                                                                       func))
-                    if permissible_exceptions and not any(
-                            isinstance(e, exception_type) for exception_type in permissible_exceptions):
+                    if permissible_exceptions and not isinstance(e, tuple(permissible_exceptions)):
                         logging.error("Exception experienced is not specified as a permissible exception."
                                       "  Rethrowing exception.")
                         raise e
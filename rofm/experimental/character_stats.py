@@ -1,4 +1,4 @@
-from rofm.classes import Roll
+from rofm.classes.rollers.roll import Roll
 
 
 def point_buy():
@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-from rofm.classes import Roll
+from rofm.classes.rollers.roll import Roll
 
 
 def display_roll(roll: Roll):
@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-from classes.tables import Table
+from rofm.classes.tables.table import Table
 
 from rofm.experimental.text import Text
 
@@ -51,7 +51,7 @@ def decline_private_messages():
 
     private_messages = FutureReddit.get_private_messages()
     for pm in private_messages:
-        logging.info("Replying to {} with an apology declining to answer their PM.".format(pm.author))
+        logging.info("Replying to %s with an apology declining to answer their PM.", pm.author)
         pm.reply(reply_text)
         FutureReddit.r.inbox.mark_read((pm,))
 
@@ -77,8 +77,7 @@ def process_mail():
                 reply_text = reply_text[:clip_point] + addition + beep_boop()
             pass
             item.reply(reply_text)
-            logging.debug("{} resolving request: {}.".format(
-                "Successfully" if okay else "Questionably", item))
+            logging.debug("%s resolving request: %s.", "Successfully" if okay else "Questionably", item)
             if not okay:
                 logging.error("Something bad happened in the 'not okay' block, but I don't log anymore.")
         else:
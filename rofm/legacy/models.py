@@ -2,15 +2,21 @@ import logging
 import random
 import re
 import string
+from bisect import bisect_left
+from itertools import accumulate
 
 from praw.exceptions import PRAWException
 from praw.models import Comment, Submission, Message
 
 from ..classes.reddit.endpoint import Reddit as FutureReddit
 
-_header_regex = "^(\d+)?[dD](\d+)(.*)"
-_line_regex = "^(\d+)(\s*-+\s*\d+)?(.*)"
-_summons_regex = "u/roll_one_for_me"
+_header_regex = re.compile(r"^(\d+)?[dD](\d+)(.*)")
+_line_regex = re.compile(r"^(\d+)(\s*-+\s*\d+)?(.*)")
+_unanchored_line_regex = re.compile(r"(\d+)(\s*-+\s*\d+)?(.*)")
+_inline_table_regex = re.compile(r"[dD](\d+)(.*)")
+_die_regex = re.compile(r"[dD]\d+")
+_link_regex = re.compile(r"\[(.*?)\]\s*\((.*?)\)")
+_summons_regex = re.compile("u/roll_one_for_me")
 
 _trash = string.punctuation + string.whitespace
 
@@ -27,42 +33,24 @@ class TableSource:
         return "<TableSource from {}>".format(self.desc)
 
     def roll(self):
-        instance = [T.roll() for T in self.tables]
         # Prune failed rolls
-        instance = [x for x in instance if x]
+        instance = [x for x in (T.roll() for T in self.tables) if x]
         if instance:
-            ret = "From {}...\n\n".format(self.desc)
-            for item in instance:
-                ret += item.unpack()
-            return ret
+            return "From {}...\n\n".format(self.desc) + "".join(item.unpack() for item in instance)
         return None
 
     def has_tables(self):
         return 0 < len(self.tables)
 
     def _parse(self):
-        indices = []
-        text = get_post_text(self.source)
-        lines = text.split("\n")
-        for line_num in range(len(lines)):
-            l = lines[line_num]
-            if re.search(_header_regex, l.strip(_trash)):
-                indices.append(line_num)
         # TODO: if no headers found?
-        if len(indices) == 0:
-            return None
-
-        table_text = []
-        for i in range(len(indices) - 1):
-            table_text.append("\n".join(lines[indices[i]:indices[i + 1]]))
-        table_text.append("\n".join(lines[indices[-1]:]))
-
-        self.tables = [Table(t) for t in table_text]
+        self.tables = [Table(t) for t in split_table_text(get_post_text(self.source))]
 
 
 class Table:
     """Container for a single set of TableItem objects
     A single post will likely contain many Table objects"""
+    __slots__ = ('text', 'die', 'header', 'outcomes', 'is_inline', '_stops')
 
     def __init__(self, text):
         self.text = text
@@ -72,32 +60,28 @@ class Table:
         self.is_inline = False
 
         self._parse()
+        # Running totals of outcome weights, so a roll can be located by bisection.
+        self._stops = list(accumulate(i.weight for i in self.outcomes))
 
     def __repr__(self):
-        return "<Table with header: {}>".format(self.text.split('\n')[0])
+        return "<Table with header: {}>".format(self.text.partition('\n')[0])
 
     def _parse(self):
         lines = self.text.split('\n')
         head = lines.pop(0)
-        head_match = re.search(_header_regex, head.strip(_trash))
+        head_match = _header_regex.search(head.strip(_trash))
         if head_match:
             self.die = int(head_match.group(2))
             self.header = head_match.group(3)
-        self.outcomes = [TableItem(l) for l in lines if re.search(_line_regex, l.strip(_trash))]
+        self.outcomes = [TableItem(l) for l in lines if _line_regex.search(l.strip(_trash))]
 
     def roll(self):
         try:
-            weights = [i.weight for i in self.outcomes]
-            total_weight = sum(weights)
+            total_weight = self._stops[-1] if self._stops else 0
             if self.die != total_weight:
                 self.header = "[Table roll error: parsed die did not match sum of item weights.]  \n" + self.header
-            # stops = [ sum(weights[:i+1]) for i in range(len(weights))]
             c = random.randint(1, self.die)
-            scan = c
-            ind = -1
-            while scan > 0:
-                ind += 1
-                scan -= weights[ind]
+            ind = bisect_left(self._stops, c)
 
             table_roll = TableRoll(d=self.die,
                                    rolled=c,
@@ -107,13 +91,14 @@ class Table:
                 table_roll.error("Expected {} items found {}".format(self.die, len(self.outcomes)))
             return table_roll
         except Exception as e:
-            logging.debug("Exception in Table roll ({}): {}".format(self, e))
+            logging.debug("Exception in Table roll (%s): %s", self, e)
             return None
 
 
 # noinspection PyBroadException
 class TableItem:
     """This class allows simple handling of in-line subtables"""
+    __slots__ = ('text', 'inline_table', 'outcome', 'weight')
 
     def __init__(self, text, w=0):
         self.text = text
@@ -132,7 +117,7 @@ class TableItem:
         return "<TableItem: {}{}>".format(self.outcome, "; has inline table" if self.inline_table else "")
 
     def _parse(self):
-        main_regex = re.search(_line_regex, self.text.strip(_trash))
+        main_regex = _line_regex.search(self.text.strip(_trash))
         if not main_regex:
             return
         # Grab outcome
@@ -148,8 +133,8 @@ class TableItem:
             except:
                 self.weight = 1
         # Identify if there is a sub-table
-        if re.search("[dD]\d+", self.outcome):
-            die_regex = re.search("[dD]\d+", self.outcome)
+        die_regex = _die_regex.search(self.outcome)
+        if die_regex:
             try:
                 self.inline_table = InlineTable(self.outcome[die_regex.start():])
             except RuntimeError as e:
@@ -170,6 +155,7 @@ class TableItem:
 # noinspection PyBroadException
 class InlineTable(Table):
     """A Table object whose text is parsed in one line, instead of expecting line breaks"""
+    __slots__ = ()
 
     def __init__(self, text):
         super().__init__(text)
@@ -179,7 +165,7 @@ class InlineTable(Table):
         return "<d{} Inline table>".format(self.die)
 
     def _parse(self):
-        top = re.search("[dD](\d+)(.*)", self.text)
+        top = _inline_table_regex.search(self.text)
         if not top:
             return
 
@@ -187,14 +173,14 @@ class InlineTable(Table):
         tail = top.group(2)
         # sub_outs = []
         while tail:
-            in_match = re.search(_line_regex, tail.strip(_trash))
+            in_match = _line_regex.search(tail.strip(_trash))
             if not in_match:
                 logging.debug("Could not complete parsing InlineTable; in_match did not catch.")
                 logging.debug("Returning blank roll area.")
                 self.outcomes = [TableItem("1-{}. N/A".format(self.die))]
                 return
             this_out = in_match.group(3)
-            next_match = re.search(_line_regex[1:], this_out)
+            next_match = _unanchored_line_regex.search(this_out)
             if next_match:
                 tail = this_out[next_match.start():]
                 this_out = this_out[:next_match.start()]
@@ -209,6 +195,8 @@ class InlineTable(Table):
 
 
 class TableRoll:
+    __slots__ = ('d', 'rolled', 'head', 'out', 'sub', 'err', 'sub_out')
+
     def __init__(self, d, rolled, head, out, err=None):
         self.d = d
         self.rolled = rolled
@@ -218,7 +206,7 @@ class TableRoll:
         self.err = err
 
         if self.sub:
-            self.sob_out = self.sub.roll()
+            self.sub_out = self.sub.roll()
 
     def __repr__(self):
         return "<d{} TableRoll: {}>".format(self.d, self.head)
@@ -227,12 +215,13 @@ class TableRoll:
         self.err = e
 
     def unpack(self):
-        ret = "{}...    \n".format(self.head.strip(_trash))
-        ret += "(d{} -> {}) {}.    \n".format(self.d, self.rolled, self.out.outcome)
+        parts = ["{}...    \n".format(self.head.strip(_trash)),
+                 "(d{} -> {}) {}.    \n".format(self.d, self.rolled, self.out.outcome)]
         if self.sub:
-            ret += "Subtable: {}".format(self.sub.roll().unpack())
-        ret += "\n\n"
-        return ret
+            # The subtable was already rolled on construction; don't roll (and parse out) a second outcome.
+            parts.append("Subtable: {}".format(self.sub_out.unpack()))
+        parts.append("\n\n")
+        return "".join(parts)
 
 
 # noinspection PyBroadException
@@ -242,12 +231,10 @@ class Request:
         self.reddit = r
         self.tables_sources = []
         self.outcome = None
+        self._seen_sources = set()
 
         self._parse()
 
-    def __repr__(self):
-        return "<Request from >".format(str(self))
-
     def __str__(self):
         if type(self.origin) == Comment:
             via = "mention in {}".format(self.origin.submission.title)
@@ -266,28 +253,49 @@ class Request:
         # Default behavior: OP and top-level comments, as applicable
 
         # print("Parsing Request...", file=sys.stderr)
-        if re.search("\[.*?\]\s*\(.*?\)", self.origin.body):
+        if _link_regex.search(self.origin.body):
             # print("Adding links...", file=sys.stderr)
             self.get_link_sources()
         else:
             # print("Adding default set...", file=sys.stderr)
             self.get_default_sources()
 
-    def _maybe_add_source(self, source, desc):
-        """Looks at PRAW submission and adds it if tables can be found."""
-        t = TableSource(source, desc)
-        if t.has_tables():
-            self.tables_sources.append(t)
+    def _maybe_add_sources(self, described_sources):
+        """Looks at each (PRAW submission, descriptor) pair and adds those in which tables can be found.
+        A source that cannot be fetched or parsed is logged and skipped without losing the others."""
+        for source, desc in self._unseen(described_sources):
+            try:
+                t = TableSource(source, desc)
+            except Exception:
+                logging.exception("Could not parse %s; skipping it.", desc)
+                continue
+            if t.has_tables():
+                self.tables_sources.append(t)
+
+    def _unseen(self, described_sources):
+        """Yields only those (source, descriptor) pairs whose source has not already been seen by this Request.
+        This only matters for link sources, where the same thread or comment may be linked more than once;
+        default sources (OP and top-level comments) are never repeated, and a Request uses one path or the other.
+        Sources without a fullname are always yielded."""
+        for source, desc in described_sources:
+            key = getattr(source, "fullname", None)
+            if key is not None:
+                if key in self._seen_sources:
+                    logging.debug("Skipping already-seen source: %s", key)
+                    continue
+                self._seen_sources.add(key)
+            yield source, desc
 
     def get_link_sources(self):
-        links = re.findall("\[.*?\]\s*\(.*?\)", self.origin.body)
+        # Capture (desc, href) in the same pass that finds each link, rather than re-matching every link.
+        links = _link_regex.findall(self.origin.body)
         # print("Link set:", file=sys.stderr)
         # print("\n".join([str(l) for l in links]), file=sys.stderr)
-        for item in links:
-            desc, href = re.search("\[(.*?)\]\s*\((.*?)\)", item).groups()
+        sources = []
+        for desc, href in links:
             href = href.strip()
             if "reddit.com" in href.lower():
-                logging.debug("Fetching href: {}".format(href.lower()))
+                logging.debug("Fetching href: %s", href.lower())
                 if "m.reddit" in href.lower():
                     logging.debug("Removing mobile 'm.'")
                     href = href.lower().replace("m.reddit", "reddit", 1)
@@ -296,34 +304,37 @@ class Request:
                     href = href[:href.find('.json')]
                 if 'www' not in href.lower():
                     logging.debug("Injecting 'www.' to href")
-                    href = href[:href.find("reddit.com")] + 'www.' + href[href.find("reddit.com"):]
+                    domain_start = href.find("reddit.com")
+                    href = href[:domain_start] + 'www.' + href[domain_start:]
                 href = href.rstrip("/")
-                logging.debug("Processing href: {}".format(href))
+                logging.debug("Processing href: %s", href)
 
-                self._maybe_add_source(FutureReddit.try_to_follow_link(href), desc)
+                sources.append((FutureReddit.try_to_follow_link(href), desc))
+        FutureReddit.prefetch(source for source, _ in sources)
+        self._maybe_add_sources(sources)
 
     def get_default_sources(self):
         """Default sources are OP and top-level comments"""
         try:
             # Add OP
-            self._maybe_add_source(self.origin.submission, "this thread's original post")
-            # Add Top-level comments
+            sources = [(self.origin.submission, "this thread's original post")]
+            # Add Top-level comments, skipping MoreComments stubs, which have neither text nor permalink.
             top_level_comments = FutureReddit.r.submission(self.origin.submission).comments
-            for item in top_level_comments:
-                self._maybe_add_source(item, "[this]({}) comment by {}".format(item.permalink, item.author))
+            sources.extend((item, "[this]({}) comment by {}".format(item.permalink, item.author))
+                           for item in top_level_comments if isinstance(item, Comment))
+            self._maybe_add_sources(sources)
         except:
             logging.debug("Could not add default sources.  (PM without links?)")
 
     def roll(self):
-        instance = [TS.roll() for TS in self.tables_sources]
-        instance = [x for x in instance if x]
+        instance = [x for x in (TS.roll() for TS in self.tables_sources) if x]
         return "\n\n-----\n\n".join(instance)
 
     def reply(self, reply_text):
         self.origin.reply(reply_text)
 
     def is_summons(self):
-        return re.search(_summons_regex, get_post_text(self.origin).lower())
+        return _summons_regex.search(get_post_text(self.origin).lower())
 
     def is_private_message(self):
         return isinstance(self.origin, Message)
@@ -343,37 +354,27 @@ class TableSourceFromText(TableSource):
 
         self._parse()
 
-    # This is nearly identical to TableSource._parse ; if this is ever
-    # used outside of testing, it behooves me to make a single
-    # unifying method
     def _parse(self):
-        indices = []
-        text = self.text
-        lines = text.split("\n")
-        for line_num in range(len(lines)):
-            l = lines[line_num]
-            if re.search(_header_regex, l.strip(_trash)):
-                indices.append(line_num)
-        if len(indices) == 0:
-            return None
-        table_text = []
-        for i in range(len(indices) - 1):
-            table_text.append("\n".join(lines[indices[i]:indices[i + 1]]))
-        table_text.append("\n".join(lines[indices[-1]:]))
-        self.tables = [Table(t) for t in table_text]
+        self.tables = [Table(t) for t in split_table_text(self.text)]
+
+
+def split_table_text(text):
+    """Splits text into one block per table, each running from a header line up to the next header line.
+    Any text before the first header is dropped."""
+    lines = text.split("\n")
+    indices = [i for i, l in enumerate(lines) if _header_regex.search(l.strip(_trash))]
+    return ["\n".join(lines[start:end]) for start, end in zip(indices, indices[1:] + [None])]
 
 
 def get_post_text(post):
     """Returns text to parse from either Comment or Submission"""
     if type(post) == Comment:
         try:
-            # logging.debug("Try the body, it's fresh")
             return post.body
         except PRAWException:
-            logging.exception("Hopefully, I'm catching a \"Had no comment\" exception.  Convoluted to-sub thing!")
-            convoluted_id = FutureReddit.r.submission(id=post.id).id_from_url((post.id))
-            submission = FutureReddit.r.submission(convoluted_id)
-            return submission.selftext
+            # Deleted or otherwise unfetchable; links to submissions never become Comments (see try_to_follow_link).
+            logging.debug("Could not fetch comment %s; treating it as empty.", post.id)
+            return ""
 
     elif type(post) == Submission:
         return post.selftext
@@ -6,6 +6,7 @@ import time
 
 from praw.models import Comment
 
+from rofm.classes.core.stack import execute
 from rofm.classes.reddit.endpoint import Reddit
 from rofm.classes.util.configuration import Config, Section, Subsection
 from rofm.classes.util.decorators import static_vars, occasional
@@ -48,8 +49,7 @@ def answer_username_mentions():
 
 def answer_mention(mention: Comment):
     context = Reddit.get_mention_context(mention)
-    while context.stack:
-        pass
+    execute(context.stack)
 
 
 def answer_private_messages():
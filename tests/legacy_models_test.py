@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+import glob
+import os
+import random
+
+from praw.exceptions import PRAWException
+from praw.models import Comment
+
+from rofm.classes.reddit.endpoint import Reddit
+from rofm.legacy.models import Request, Table, TableSourceFromText, get_post_text
+
+examples_directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "rofm", "examples")
+
+
+class RequestWithoutFetching(Request):
+    """A Request that skips fetching its sources on construction, so sources can be supplied directly."""
+    def _parse(self):
+        pass
+
+
+def make_comment(comment_id, body):
+    return Comment(Reddit.r, _data={"id": comment_id, "body": body})
+
+
+def linear_scan_outcome(table, rolled):
+    """Outcome selection as Table.roll made it before cumulative weights were precomputed."""
+    weights = [i.weight for i in table.outcomes]
+    scan = rolled
+    ind = -1
+    while scan > 0:
+        ind += 1
+        scan -= weights[ind]
+    return table.outcomes[ind]
+
+
+def test_rolls_match_linear_scan():
+    tables_checked = 0
+    for path in sorted(glob.glob(os.path.join(examples_directory, "*.txt"))):
+        with open(path) as f:
+            source = TableSourceFromText(f.read(), os.path.basename(path))
+        for table in source.tables:
+            if table.die is None:
+                continue
+            tables_checked += 1
+            for seed in range(50):
+                random.seed(seed)
+                table_roll = table.roll()
+                random.seed(seed)
+                rolled = random.randint(1, table.die)
+                try:
+                    expected = linear_scan_outcome(table, rolled)
+                except IndexError:
+                    assert table_roll is None, "{} seed {}: expected a failed roll".format(table, seed)
+                    continue
+                assert table_roll.rolled == rolled
+                assert table_roll.out is expected, "{} seed {}: {} != {}".format(
+                    table, seed, table_roll.out, expected)
+    assert tables_checked, "No example tables found in {}".format(examples_directory)
+
+
+def test_subtable_line_matches_stored_roll():
+    table = Table("d1 Pick one\n1. Result d3 1 Red 2 Green 3 Blue")
+    for seed in range(20):
+        random.seed(seed)
+        table_roll = table.roll()
+        reply = table_roll.unpack()
+        assert "Subtable: " + table_roll.sub_out.unpack() in reply, reply
+        # Unpacking renders the stored subtable roll; it must not roll again.
+        assert reply == table_roll.unpack()
+
+
+def test_repeated_source_is_parsed_once():
+    request = RequestWithoutFetching(None, Reddit.r)
+    text = "d2 Coin\n1. Heads\n2. Tails"
+    request._maybe_add_sources([(make_comment("abc123", text), "the first link"),
+                                (make_comment("abc123", text), "the same comment, linked again"),
+                                (make_comment("def456", text), "a different comment")])
+    descriptions = [source.desc for source in request.tables_sources]
+    assert descriptions == ["the first link", "a different comment"], descriptions
+
+
+class NothingReturnedReddit:
+    """Stands in for Reddit.r when /api/info returns none of the requested items."""
+    def info(self, fullnames):
+        return iter(())
+
+
+def test_unfetchable_linked_comment_is_skipped():
+    gone = Comment(Reddit.r, id="gone12")
+
+    def fetch_fails():
+        raise PRAWException("No data returned for comment gone12")
+    gone._fetch = fetch_fails
+
+    live_reddit = Reddit.r
+    Reddit.r = NothingReturnedReddit()
+    try:
+        Reddit.prefetch([gone])
+    finally:
+        Reddit.r = live_reddit
+    assert get_post_text(gone) == ""
+
+    request = RequestWithoutFetching(None, Reddit.r)
+    request._maybe_add_sources([(gone, "a deleted comment"),
+                                (make_comment("abc123", "d2 Coin\n1. Heads\n2. Tails"), "a live comment")])
+    descriptions = [source.desc for source in request.tables_sources]
+    assert descriptions == ["a live comment"], descriptions
+
+
+if __name__ == '__main__':
+    test_rolls_match_linear_scan()
+    test_subtable_line_matches_stored_roll()
+    test_repeated_source_is_parsed_once()
+    test_unfetchable_linked_comment_is_skipped()
+    print("Passed.")
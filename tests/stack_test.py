@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+
+from rofm.classes.core.stack import Stack, execute, pack, unpack
+
+
+def test_unpack_calls_package():
+    assert unpack(pack(max, 1, 3, 2)) == 3
+    assert unpack([sorted, ([3, 1, 2],), {"reverse": True}]) == [3, 2, 1]
+
+
+def test_unpack_rejects_wrong_length():
+    for bad in ((max, (1, 2)), (max, (1, 2), {}, None)):
+        try:
+            unpack(bad)
+        except AssertionError:
+            continue
+        raise AssertionError("unpack accepted a {}-tuple: {}".format(len(bad), bad))
+
+
+def test_stack_pops_first_listed_action_first():
+    stack = Stack("first", "second", "third")
+    assert [stack.pop() for _ in range(3)] == ["first", "second", "third"]
+    assert stack.height == 3, stack.height
+
+
+def test_execute_runs_follow_up_packages_first():
+    executed = []
+
+    def step(name):
+        executed.append(name)
+        if name == "parse":
+            return [pack(step, "roll 1"), pack(step, "roll 2")]
+        if name == "roll 2":
+            return "a table roll, not more work"
+
+    stack = Stack(pack(step, "parse"), pack(step, "reply"))
+    execute(stack)
+    assert executed == ["parse", "roll 1", "roll 2", "reply"], executed
+    assert not stack
+    assert stack.height == 4, stack.height
+
+
+if __name__ == '__main__':
+    test_unpack_calls_package()
+    test_unpack_rejects_wrong_length()
+    test_stack_pops_first_listed_action_first()
+    test_execute_runs_follow_up_packages_first()
+    print("Passed.")